@@ -8,45 +8,337 @@ Usage:
     marc isbn       # Search by keyword in descriptions
 """
 
-import argparse
+import bisect
+import functools
 import json
-import subprocess
+import mmap
+import os
+import pickle
+import re
 import sys
+import types
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+if sys.stdout.isatty():
+    from colorama import Fore, Style
+
+    # colorama is only needed to translate ANSI codes for Windows consoles;
+    # every other terminal understands them natively
+    if sys.platform == "win32":
+        from colorama import init
+
+        init(autoreset=True)
+else:
+    # Plain text when output is piped or redirected - no need for colorama,
+    # just blank out every color code
+    _NO_COLOR = dict.fromkeys(
+        "BLUE CYAN GREEN MAGENTA RED WHITE YELLOW BRIGHT DIM RESET_ALL".split(), ""
+    )
+    Fore = Style = types.SimpleNamespace(**_NO_COLOR)
+
+# Bump whenever the structure of the pickled caches changes
+_CACHE_VERSION = 1
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Delimiters treated as word breaks in descriptions
+_DELIM = str.maketrans("-/,()", "     ")
+
+
+class Entry(NamedTuple):
+    """A single field or subfield definition from a data file."""
+
+    Key: str
+    Value: str
+    Created: str
+    # Only present for fields in marc-verbose.json
+    Details: Optional[dict] = None
+
+
+def _read_json(json_path: Path) -> Dict[str, dict]:
+    """Parse a whole JSON data file (entries stay plain dicts)."""
+    # orjson is worth its import time only for whole-file parses; single
+    # entries are parsed with the json module (see MarcStore.get)
+    import orjson
+
+    return orjson.loads(json_path.read_bytes())
+
+
+def _load_cached(
+    json_path: Path,
+    suffix: str,
+    build: Callable[[Path], Any],
+    refresh: bool = False,
+    fallback: Optional[Callable[[Path], Any]] = None,
+) -> Any:
+    """
+    Return build(json_path) via a sibling pickle cache (json_path + suffix).
+    The cache is rebuilt whenever it is missing, was built from a different
+    version of the JSON file (size or mtime differ) or was written by an
+    incompatible version of marcfinder, or when refresh is set.
+    If the cache can't be saved (read-only installation), fallback(json_path)
+    is returned instead when given, as the build would be repeated every run.
+    """
+    cache = json_path.with_suffix(suffix)
+    # Taken before building, so a JSON file replaced mid-build is never
+    # mistaken for the one the cache was built from
+    source_stat = json_path.stat()
+    source = (source_stat.st_size, source_stat.st_mtime_ns)
+
+    if not refresh:
+        try:
+            with open(cache, "rb") as f:
+                version, cached_source, data = pickle.load(f)
+            if version == _CACHE_VERSION and cached_source == source:
+                return data
+        except Exception:
+            # Missing, unreadable or corrupt cache - fall through and rebuild it
+            pass
+
+    if fallback is not None and not os.access(cache.parent, os.W_OK):
+        return fallback(json_path)
+
+    data = build(json_path)
+
+    # Write atomically so concurrent invocations never see a partial cache
+    import tempfile
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    (_CACHE_VERSION, source, data),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            # mkstemp creates the file owner-only; let everyone who can read
+            # the data file read its cache too
+            os.chmod(tmp_path, source_stat.st_mode & 0o666)
+            os.replace(tmp_path, cache)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Read-only installation - just skip caching
+        pass
+
+    return data
+
+
+def build_index(json_path: Path) -> Dict[str, Tuple[int, int]]:
+    """
+    Map each top-level key of a JSON data file to the (offset, length) in bytes
+    of its value, so single entries can be parsed without reading the whole file.
+    """
+    # Decode without newline translation, or CRLF files would lose a byte per
+    # line and every later offset would be wrong
+    text = json_path.read_bytes().decode("utf-8")
+    decoder = json.JSONDecoder()
+    index = {}
+
+    # raw_decode() works with character positions but the file is mmapped as
+    # bytes, so keep a running conversion between the two
+    char_pos = byte_pos = 0
+
+    def to_byte_offset(pos: int) -> int:
+        nonlocal char_pos, byte_pos
+        byte_pos += len(text[char_pos:pos].encode("utf-8"))
+        char_pos = pos
+        return byte_pos
+
+    pos = _WHITESPACE.match(text, text.index("{") + 1).end()
+    while text[pos] != "}":
+        key, pos = decoder.raw_decode(text, pos)
+        pos = _WHITESPACE.match(text, text.index(":", pos) + 1).end()
+        _, end = decoder.raw_decode(text, pos)
+
+        start = to_byte_offset(pos)
+        index[key] = (start, to_byte_offset(end) - start)
+
+        pos = _WHITESPACE.match(text, end).end()
+        if text[pos] == ",":
+            pos = _WHITESPACE.match(text, pos + 1).end()
+
+    return index
 
-from colorama import init, Fore, Style
 
-# Initialize colorama for cross-platform color support
-init(autoreset=True)
+def split_words(value_lower: str) -> List[str]:
+    """Split a lower-cased description into words on whitespace and common delimiters."""
+    return value_lower.translate(_DELIM).split()
 
 
-def load_marc_data() -> Dict[str, dict]:
+def _keyword_corpus(entries: Dict[str, dict]) -> Dict[str, Any]:
+    """The "corpus", "starts" and "keys" parts of a keyword index."""
+    values = []
+    starts = []
+    offset = 0
+    for entry in entries.values():
+        value_lower = entry["Value"].lower()
+        values.append(value_lower)
+        starts.append(offset)
+        offset += len(value_lower) + 1
+    return {"corpus": "\0".join(values), "starts": starts, "keys": list(entries)}
+
+
+def build_keyword_index(json_path: Path) -> Dict[str, Any]:
+    """
+    Precompute everything keyword searches need from a JSON data file:
+      "words": description word -> frozenset of keys of the entries containing it
+      "corpus": every lower-cased description, joined with NUL separators
+      "starts": offset of each description within the corpus
+      "keys": key of each description in the corpus
+    The corpus, starts and keys are in entry order.
+    """
+    entries = _read_json(json_path)
+    words = {}
+    for key, entry in entries.items():
+        for word in split_words(entry["Value"].lower()):
+            words.setdefault(word, set()).add(key)
+    return {
+        "words": {word: frozenset(word_keys) for word, word_keys in words.items()},
+        **_keyword_corpus(entries),
+    }
+
+
+class MarcStore:
+    """
+    Read-only access to a MARC data file.
+
+    Single entries are parsed straight out of the memory-mapped JSON file using
+    a cached key -> (offset, length) index (see build_index). Searches that
+    have to look at every entry use the precomputed keyword index instead, so
+    the whole file is only loaded when a cache needs rebuilding, or on every
+    run when the index can't be cached at all.
+    """
+
+    def __init__(self, json_path: Path):
+        self.path = json_path
+        self._mmap = None
+        self._keyword_index = None
+        self._refreshed = False
+        self._load_index()
+
+    def _load_index(self, refresh: bool = False) -> None:
+        self._entries = None
+        self._index = _load_cached(
+            self.path, ".idx", build_index, refresh, self._read_all
+        )
+        # Lower-cased keys in sorted order, with the original keys alongside,
+        # for case-insensitive prefix lookups by bisection
+        pairs = sorted((key.lower(), key) for key in self._index)
+        self._sorted_lower = [lower for lower, _ in pairs]
+        self._sorted_keys = [key for _, key in pairs]
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _read_all(self, json_path: Path) -> Dict[str, None]:
+        # Without a saved index, one plain parse of the whole file is cheaper
+        # than building the index on every run
+        self._entries = _read_json(json_path)
+        return dict.fromkeys(self._entries)
+
+    def _scan_keywords(self, json_path: Path) -> Dict[str, Any]:
+        # Without a saved keyword index, skip the word postings: they cost more
+        # to build than a single search saves (see search_by_keyword)
+        if self._entries is None:
+            self._entries = _read_json(json_path)
+        return {"words": None, **_keyword_corpus(self._entries)}
+
+    def _parse(self, key: str) -> Entry:
+        if self._entries is not None:
+            return Entry(**self._entries[key])
+        if self._mmap is None:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        offset, length = self._index[key]
+        entry = Entry(**json.loads(self._mmap[offset : offset + length]))
+        if entry.Key != key:
+            raise ValueError(f"index points {key} at {entry.Key}")
+        return entry
+
+    def get(self, key: str) -> Optional[Entry]:
+        """
+        Parse a single entry from the data file. Returns None for a key that is
+        no longer in the file (it changed after the key was looked up).
+        """
+        try:
+            return self._parse(key)
+        except (KeyError, ValueError, TypeError):
+            if not self._refreshed:
+                # The file changed under caches that still looked valid -
+                # rebuild them all and try once more
+                self._refresh()
+            elif key in self._index:
+                raise
+        return self._parse(key) if key in self._index else None
+
+    def _refresh(self) -> None:
+        self._refreshed = True
+        self._load_index(refresh=True)
+        self._load_keyword_index(refresh=True)
+
+    def keys_with_prefix(self, prefix: str) -> List[str]:
+        """Return the keys starting with prefix (case-insensitive), sorted."""
+        prefix = prefix.lower()
+        i = bisect.bisect_left(self._sorted_lower, prefix)
+        matches = []
+        while i < len(self._sorted_lower) and self._sorted_lower[i].startswith(prefix):
+            matches.append(self._sorted_keys[i])
+            i += 1
+        return matches
+
+    @property
+    def keyword_index(self) -> Dict[str, Any]:
+        """Precomputed keyword search data (see build_keyword_index)."""
+        if self._keyword_index is None:
+            self._load_keyword_index()
+        return self._keyword_index
+
+    def _load_keyword_index(self, refresh: bool = False) -> None:
+        self._keyword_index = _load_cached(
+            self.path,
+            ".keywords.idx",
+            build_keyword_index,
+            refresh,
+            self._scan_keywords,
+        )
+
+    def build_caches(self) -> None:
+        """Bring every on-disk cache for this data file up to date."""
+        self.keyword_index
+
+
+def load_marc_data() -> MarcStore:
     """Load MARC field data from marc.json."""
     data_file = Path(__file__).parent.parent / "marc.json"
 
     if not data_file.exists():
-        print(f"{Fore.RED}Error: marc.json not found at {data_file}")
-        print(f"{Fore.YELLOW}Run 'python scrape_marc.py' to generate the data file.")
+        print(f"{Fore.RED}Error: marc.json not found at {data_file}{Style.RESET_ALL}")
+        print(
+            f"{Fore.YELLOW}Run 'python scrape_marc.py' to generate the data file.{Style.RESET_ALL}"
+        )
         sys.exit(1)
 
-    with open(data_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return MarcStore(data_file)
 
 
-def load_verbose_data() -> Dict[str, dict]:
+def load_verbose_data() -> MarcStore:
     """Load detailed MARC field data from marc-verbose.json."""
     data_file = Path(__file__).parent.parent / "marc-verbose.json"
 
     if not data_file.exists():
-        print(f"{Fore.RED}Error: marc-verbose.json not found at {data_file}")
         print(
-            f"{Fore.YELLOW}Run 'python scrape_marc.py' to generate the verbose data file."
+            f"{Fore.RED}Error: marc-verbose.json not found at {data_file}{Style.RESET_ALL}"
+        )
+        print(
+            f"{Fore.YELLOW}Run 'python scrape_marc.py' to generate the verbose data file.{Style.RESET_ALL}"
         )
         sys.exit(1)
 
-    with open(data_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return MarcStore(data_file)
 
 
 def is_code_query(query: str) -> bool:
@@ -59,62 +351,36 @@ def is_range_query(query: str) -> bool:
     return len(query) == 3 and query[0].isdigit() and query[1:].lower() == "xx"
 
 
-def search_by_range(data: Dict[str, dict], range_prefix: str) -> List[Tuple[str, dict]]:
-    """
-    Search for all fields in a range (e.g., 1xx returns all 100-199 fields).
-    Returns list of (key, entry) tuples for fields only (no subfields).
-    """
-    start = int(range_prefix[0]) * 100
-    end = start + 100
-    matches = []
-
-    for key, entry in data.items():
-        # Only include 3-digit field codes, not subfields
-        if len(key) == 3 and key.isdigit():
-            field_num = int(key)
-            if start <= field_num < end:
-                matches.append((key, entry))
-
-    # Sort numerically
-    matches.sort(key=lambda x: int(x[0]))
-    return matches
-
-
-def search_by_code(data: Dict[str, dict], code: str) -> List[Tuple[str, dict]]:
+def search_by_code(data: MarcStore, code: str) -> List[Tuple[str, Entry]]:
     """
     Search for fields/subfields by code prefix.
     Returns list of (key, entry) tuples matching the code.
     """
-    code_lower = code.lower()
-    matches = []
-
-    for key, entry in data.items():
-        if key.lower().startswith(code_lower):
-            matches.append((key, entry))
-
-    # Sort by:
+    # Order results by:
     # 1. Key length (exact match first - field before subfields)
     # 2. For subfields (len > 3): alphabetic subfields (a-z) before numeric (0-9)
-    # 3. Then alphabetically within each group
-    def sort_key(item):
-        key = item[0]
+    # 3. Then alphabetically within each group (keys_with_prefix is sorted)
+    fields = []
+    alpha_subfields = []
+    numeric_subfields = []
+
+    for key in data.keys_with_prefix(code):
         if len(key) == 3:
-            # Field code - comes first
-            return (0, key)
+            fields.append(key)
+        elif key[3].isalpha():
+            alpha_subfields.append(key)
         else:
-            # Subfield - separate alphabetic from numeric
-            subfield_char = key[3]
-            if subfield_char.isalpha():
-                return (1, key)  # Alphabetic subfields
-            else:
-                return (2, key)  # Numeric subfields
-
-    matches.sort(key=sort_key)
+            numeric_subfields.append(key)
 
+    matches = []
+    for key in fields + alpha_subfields + numeric_subfields:
+        entry = data.get(key)
+        if entry is not None:
+            matches.append((key, entry))
     return matches
 
 
-def search_by_range(data: Dict[str, dict], range_prefix: str) -> List[Tuple[str, dict]]:
+def search_by_range(data: MarcStore, range_prefix: str) -> List[Tuple[str, Entry]]:
     """
     Search for all fields in a range (e.g., 1xx returns all 100-199 fields).
     Returns list of (key, entry) tuples for fields only (no subfields).
@@ -123,58 +389,68 @@ def search_by_range(data: Dict[str, dict], range_prefix: str) -> List[Tuple[str,
     end = start + 100
     matches = []
 
-    for key, entry in data.items():
+    # Sorted 3-digit keys are also in numeric order
+    for key in data.keys_with_prefix(range_prefix[0]):
         # Only include 3-digit field codes, not subfields
         if len(key) == 3 and key.isdigit():
             field_num = int(key)
-            if start <= field_num < end:
+            entry = data.get(key) if start <= field_num < end else None
+            if entry is not None:
                 matches.append((key, entry))
 
-    # Sort numerically
-    matches.sort(key=lambda x: int(x[0]))
     return matches
 
 
-def search_by_keyword(
-    data: Dict[str, dict], keyword: str
-) -> List[Tuple[str, dict, bool]]:
+def search_by_keyword(data: MarcStore, keyword: str) -> List[Tuple[str, Entry]]:
     """
     Search for fields/subfields by keyword in description.
-    Returns list of (key, entry, is_exact_match) tuples.
+    Returns list of (key, entry) tuples, exact word matches first.
     """
     keyword_lower = keyword.lower()
-    matches = []
-
-    for key, entry in data.items():
-        value_lower = entry["Value"].lower()
-
-        # Check for exact word match vs partial match
-        # Split by common delimiters and check if keyword matches a whole word
-        words = (
-            value_lower.replace("-", " ")
-            .replace("/", " ")
-            .replace(",", " ")
-            .replace("(", " ")
-            .replace(")", " ")
-            .split()
-        )
-        is_exact = keyword_lower in words
+    index = data.keyword_index
+    words = index["words"]
+    exact = words.get(keyword_lower, frozenset()) if words is not None else None
+    corpus, starts, keys = index["corpus"], index["starts"], index["keys"]
+    exact_field, exact_sub, partial_field, partial_sub = [], [], [], []
+
+    # str.find scans the whole corpus in C; a keyword can never contain the NUL
+    # separator, so every hit lies inside a single description. After a hit,
+    # resume at the next description so each entry is reported once.
+    pos = corpus.find(keyword_lower)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        if i + 1 < len(starts):
+            pos = corpus.find(keyword_lower, starts[i + 1])
+        else:
+            pos = -1
+        key = keys[i]
+        entry = data.get(key)
+        if entry is None:
+            continue
+        if exact is None:
+            # Index without word postings - check the hit itself
+            is_exact = keyword_lower in split_words(entry.Value.lower())
+        else:
+            is_exact = key in exact
+        if is_exact:
+            bucket = exact_field if len(key) == 3 else exact_sub
+        else:
+            bucket = partial_field if len(key) == 3 else partial_sub
+        bucket.append((key, entry))
 
-        if keyword_lower in value_lower:
-            matches.append((key, entry, is_exact))
+    # Order: exact word matches first, then fields (3 chars) before subfields.
+    # Hits arrive in sorted key order and every subfield key has the same
+    # length, so each bucket is already sorted.
+    return exact_field + exact_sub + partial_field + partial_sub
 
-    # Sort:
-    # 1. Exact word matches first (is_exact=True comes before is_exact=False)
-    # 2. Within same exactness, fields (3 chars) before subfields (4+ chars)
-    # 3. Then by length (shorter first)
-    # 4. Then alphabetically
-    matches.sort(key=lambda x: (not x[2], len(x[0]) > 3, len(x[0]), x[0]))
 
-    return [(k, e) for k, e, _ in matches]
+_R_SUFFIX = f"{Fore.GREEN}(R){Style.RESET_ALL}"
+_NR_SUFFIX = f"{Fore.YELLOW}(NR){Style.RESET_ALL}"
 
 
-def format_output(key: str, value: str) -> str:
-    """Format a single entry with colors."""
+@functools.lru_cache(maxsize=4096)
+def _display_key(key: str) -> str:
+    """Colored key plus alignment spacing; only depends on the key, so memoized."""
     # Determine if it's a field (3 digits) or subfield (3+ chars)
     is_field = len(key) == 3
 
@@ -191,32 +467,37 @@ def format_output(key: str, value: str) -> str:
         display_key = f"{field_part}{subfield_part}"
         spacing = "  "
 
+    return f"{display_key}{Style.RESET_ALL}{spacing}"
+
+
+def format_output(key: str, value: str) -> str:
+    """Format a single entry with colors."""
     # Extract repeatability indicator
     repeatability = ""
     if value.endswith("(R)"):
-        repeatability = f"{Fore.GREEN}(R){Style.RESET_ALL}"
+        repeatability = _R_SUFFIX
         value = value[:-3].strip()
     elif value.endswith("(NR)"):
-        repeatability = f"{Fore.YELLOW}(NR){Style.RESET_ALL}"
+        repeatability = _NR_SUFFIX
         value = value[:-4].strip()
 
-    return f"{display_key}{Style.RESET_ALL}{spacing}{value} {repeatability}"
+    return f"{_display_key(key)}{value} {repeatability}"
 
 
-def format_verbose_output(key: str, entry: dict) -> str:
+def format_verbose_output(key: str, entry: Entry) -> str:
     """Format detailed field information for verbose mode."""
     output = []
 
     # Only show verbose details for 3-digit field codes (not subfields)
-    if len(key) != 3 or "Details" not in entry:
+    if len(key) != 3 or entry.Details is None:
         # Fall back to normal format for subfields or if no details
-        return format_output(key, entry["Value"])
+        return format_output(key, entry.Value)
 
-    details = entry["Details"]
+    details = entry.Details
 
     # Header with field code and title
     output.append(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * 70}")
-    output.append(f"{Fore.CYAN}{Style.BRIGHT}{key} - {entry['Value']}")
+    output.append(f"{Fore.CYAN}{Style.BRIGHT}{key} - {entry.Value}")
     output.append(f"{Fore.CYAN}{Style.BRIGHT}{'=' * 70}{Style.RESET_ALL}\n")
 
     # Definition
@@ -263,27 +544,32 @@ def format_verbose_output(key: str, entry: dict) -> str:
     return "\n".join(output)
 
 
-def display_results(matches: List[Tuple[str, dict]], verbose: bool = False):
+def display_results(matches: List[Tuple[str, Entry]], verbose: bool = False):
     """Display search results with formatting."""
     if not matches:
-        print(f"{Fore.YELLOW}No matches found.")
+        print(f"{Fore.YELLOW}No matches found.{Style.RESET_ALL}")
         return
 
     if verbose:
         # In verbose mode, only show fields (3 digits), not subfields
         # Subfields are already included in the verbose field display
-        for key, entry in matches:
-            if len(key) == 3:  # Only show fields, skip subfields
-                print(format_verbose_output(key, entry))
+        lines = [
+            format_verbose_output(key, entry) for key, entry in matches if len(key) == 3
+        ]
     else:
-        for key, entry in matches:
-            print(format_output(key, entry["Value"]))
+        lines = [format_output(key, entry.Value) for key, entry in matches]
+
+    # One write instead of a print() per match
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def update_installation() -> None:
     """Run git pull in the installation directory to update marcfinder."""
+    import subprocess
+
     repo_dir = Path(__file__).parent.parent
-    print(f"{Fore.CYAN}Updating marcfinder from {repo_dir}...")
+    print(f"{Fore.CYAN}Updating marcfinder from {repo_dir}...{Style.RESET_ALL}")
     try:
         result = subprocess.run(
             ["git", "pull"],
@@ -296,17 +582,23 @@ def update_installation() -> None:
         if result.stderr:
             print(result.stderr.rstrip())
         if result.returncode == 0:
-            print(f"{Fore.GREEN}Update complete.")
+            print(f"{Fore.GREEN}Update complete.{Style.RESET_ALL}")
         else:
-            print(f"{Fore.RED}git pull failed (exit code {result.returncode}).")
+            print(
+                f"{Fore.RED}git pull failed (exit code {result.returncode}).{Style.RESET_ALL}"
+            )
             sys.exit(result.returncode)
     except FileNotFoundError:
-        print(f"{Fore.RED}Error: git not found. Is git installed and on your PATH?")
+        print(
+            f"{Fore.RED}Error: git not found. Is git installed and on your PATH?{Style.RESET_ALL}"
+        )
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point."""
+def _build_parser():
+    """Build the argument parser (argparse is only imported when needed)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Look up MARC 21 bibliographic field definitions",
         epilog="Examples:\n  marc 020      Look up ISBN field\n  marc 245a     Look up title subfield\n  marc 5xx      List all 5XX note fields\n  marc isbn     Search for ISBN-related fields\n  marc -v 245   Show detailed information for field 245\n  marc --update Update marcfinder via git pull",
@@ -330,25 +622,37 @@ def main():
         help="Update marcfinder by running git pull in the installation directory",
     )
 
-    args = parser.parse_args()
+    return parser
 
-    if args.update:
-        update_installation()
-        return
 
-    if not args.query:
-        parser.print_help()
-        sys.exit(0)
+def main():
+    """Main CLI entry point."""
+    # Fast path for the common `marc <query>` call - skips argparse entirely
+    if len(sys.argv) == 2 and sys.argv[1] and not sys.argv[1].startswith("-"):
+        query = sys.argv[1]
+        verbose = False
+    else:
+        parser = _build_parser()
+        args = parser.parse_args()
+
+        if args.update:
+            update_installation()
+            return
+
+        if not args.query:
+            parser.print_help()
+            sys.exit(0)
+
+        query = args.query
+        verbose = args.verbose
 
     # Load data (verbose or regular)
-    if args.verbose:
+    if verbose:
         data = load_verbose_data()
     else:
         data = load_marc_data()
 
     # Determine query type and search
-    query = args.query
-
     if is_code_query(query):
         if is_range_query(query):
             # Range lookup (e.g., 1xx, 5xx)
@@ -356,31 +660,37 @@ def main():
             if matches:
                 range_name = f"{query[0]}XX"
                 print(
-                    f"{Fore.GREEN}Fields in {range_name} range ({len(matches)} total):\n"
+                    f"{Fore.GREEN}Fields in {range_name} range ({len(matches)} total):{Style.RESET_ALL}\n"
                 )
                 display_results(matches, verbose=False)  # Never verbose for ranges
             else:
-                print(f"{Fore.YELLOW}No fields found in range: {Fore.WHITE}{query}")
+                print(
+                    f"{Fore.YELLOW}No fields found in range: {Fore.WHITE}{query}{Style.RESET_ALL}"
+                )
         else:
             # Code lookup
             matches = search_by_code(data, query)
             if matches:
-                display_results(matches, verbose=args.verbose)
+                display_results(matches, verbose=verbose)
             else:
-                print(f"{Fore.YELLOW}No field found matching code: {Fore.WHITE}{query}")
+                print(
+                    f"{Fore.YELLOW}No field found matching code: {Fore.WHITE}{query}{Style.RESET_ALL}"
+                )
     else:
         # Keyword search - always use simple format (verbose produces too much output)
-        if args.verbose:
+        if verbose:
             print(
-                f"{Fore.YELLOW}Note: Verbose mode is not available for keyword searches.\n"
+                f"{Fore.YELLOW}Note: Verbose mode is not available for keyword searches.{Style.RESET_ALL}\n"
             )
         matches = search_by_keyword(data, query)
         if matches:
             if len(matches) > 1:
-                print(f"{Fore.GREEN}Found {len(matches)} matches:\n")
+                print(f"{Fore.GREEN}Found {len(matches)} matches:{Style.RESET_ALL}\n")
             display_results(matches, verbose=False)  # Always False for keyword searches
         else:
-            print(f"{Fore.YELLOW}No fields found matching keyword: {Fore.WHITE}{query}")
+            print(
+                f"{Fore.YELLOW}No fields found matching keyword: {Fore.WHITE}{query}{Style.RESET_ALL}"
+            )
 
 
 if __name__ == "__main__":
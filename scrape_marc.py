@@ -6,20 +6,54 @@ Scrapes field definitions from Library of Congress MARC 21 documentation
 and generates/updates marc.json with complete field and subfield data.
 """
 
-import json
+import hashlib
 import re
+import shelve
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 
+from marc_cli.main import MarcStore
 
 BASE_URL = "https://www.loc.gov/marc/bibliographic/"
 
+# Number of pages fetched concurrently
+MAX_WORKERS = 16
+
+# Shared session, created on first use (see get_session)
+_session = None
+_session_lock = threading.Lock()
+
+# Parsed concise pages, keyed by field number and page content hash. Bump the
+# version whenever parse_detailed_field_info() changes
+PARSED_CACHE_FILE = Path(__file__).parent / "loc_cache_parsed"
+PARSED_CACHE_VERSION = 1
+_parsed_cache_lock = threading.Lock()
+
+# Serializes progress output from the worker threads
+_log_lock = threading.Lock()
+
+# Everything we extract lives in <body>; skip parsing <head> (scripts, styles)
+_BODY_ONLY = SoupStrainer("body")
+
+# Field line: 3 digits, space/dash, description, repeatability in parens
+_FIELD_RE = re.compile(r"(\d{3})\s*[-–]\s*([^(]+?)\s*\(([RN]{1,2})\)")
+# Subfield line: $letter/digit - description (R/NR)
+_SUBFIELD_RE = re.compile(
+    r"\$([a-z0-9])\s*[-–]\s*([^(]+?)\s*\(([RN]{1,2})\)", re.IGNORECASE
+)
+_WS_RE = re.compile(r"\s+")
+
 # Field range pages to scrape
 FIELD_RANGE_PAGES = [
     # "bd00x.html",  # Control Fields - SKIPPED: missing (R)/(NR) markers, handled via CONTROL_FIELDS
@@ -117,12 +151,50 @@ FIELD_222_MANUAL = {
 }
 
 
+def log(message: str = "") -> None:
+    """Print a progress message without interleaving output between threads."""
+    with _log_lock:
+        print(message)
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared session, so requests reuse pooled keep-alive connections.
+    Responses are cached on disk and revalidated with conditional requests
+    (ETag / Last-Modified) once a day, so unchanged pages come back as
+    bodiless 304s.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests_cache.CachedSession(
+                str(Path(__file__).parent / "loc_cache"),
+                backend="sqlite",
+                expire_after=86400,
+                cache_control=True,
+            )
+            _session.mount(
+                "https://", HTTPAdapter(pool_connections=32, pool_maxsize=32)
+            )
+        return _session
+
+
+def fetch_html(url: str) -> bytes:
+    """Fetch a web page (served from the HTTP cache when still fresh)."""
+    log(f"Fetching {url}...")
+    response = get_session().get(url, timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def parse_html(content: bytes) -> BeautifulSoup:
+    """Parse the body of an HTML page."""
+    return BeautifulSoup(content, "lxml", parse_only=_BODY_ONLY)
+
+
 def fetch_page(url: str) -> BeautifulSoup:
     """Fetch and parse a web page."""
-    print(f"Fetching {url}...")
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    return BeautifulSoup(response.content, "html.parser")
+    return parse_html(fetch_html(url))
 
 
 def extract_field_links(soup: BeautifulSoup) -> List[Tuple[str, str, str]]:
@@ -136,10 +208,7 @@ def extract_field_links(soup: BeautifulSoup) -> List[Tuple[str, str, str]]:
     # These appear as text in the page, often in <strong> tags or plain text
     text_content = soup.get_text()
 
-    # Pattern: 3 digits, space/dash, description, repeatability in parens
-    pattern = r"(\d{3})\s*[-–]\s*([^(]+?)\s*\(([RN]{1,2})\)"
-
-    for match in re.finditer(pattern, text_content):
+    for match in _FIELD_RE.finditer(text_content):
         field_num = match.group(1)
         description = match.group(2).strip()
         repeatability = match.group(3).strip()
@@ -153,154 +222,184 @@ def extract_field_links(soup: BeautifulSoup) -> List[Tuple[str, str, str]]:
     return fields
 
 
-def extract_detailed_field_info(field_num: str) -> dict:
+def parse_detailed_field_info(soup: BeautifulSoup) -> dict:
     """
-    Fetch detailed field information from the concise LOC page.
+    Extract detailed field information from a parsed concise LOC page.
     Returns dict with definition, indicators, subfields, and examples.
     """
-    # LDR has a non-standard URL
-    if field_num.upper() == "LDR":
-        concise_url = urljoin(BASE_URL, "concise/bdleader.html")
+    field_info = {
+        "definition": "",
+        "indicators": {},
+        "subfields": {},
+        "examples": [],
+    }
+
+    # Extract definition
+    # Standard pages use <div class="definition"><p>...</p></div>
+    # Control field pages use plain <p> tags after the last <hr/>
+    definition_div = soup.find("div", class_="definition")
+    if definition_div:
+        p_tag = definition_div.find("p")
+        if p_tag:
+            field_info["definition"] = " ".join(p_tag.get_text().split())
     else:
-        concise_url = urljoin(BASE_URL, f"concise/bd{field_num}.html")
+        # Fallback: control field pages use plain <p> tags for definition.
+        # Content appears after the <hr/> that follows <div class="datename">.
+        datename_div = soup.find("div", class_="datename")
+        if datename_div:
+            # Find the first <hr/> after the datename div
+            content_hr = None
+            for sibling in datename_div.find_next_siblings():
+                if sibling.name == "hr":
+                    content_hr = sibling
+                    break
+            if content_hr:
+                paragraphs = []
+                for sibling in content_hr.find_next_siblings():
+                    if sibling.name in ("div", "table") and sibling.get("class"):
+                        break  # stop at examples/other sections
+                    if sibling.name == "p":
+                        text = " ".join(sibling.get_text().split())
+                        if text:
+                            paragraphs.append(text)
+                if paragraphs:
+                    field_info["definition"] = " ".join(paragraphs)
+
+    # Extract indicators
+    indicators_div = soup.find("div", class_="indicators")
+    if indicators_div:
+        dts = indicators_div.find_all("dt")
+        for dt in dts:
+            indicator_name = dt.get_text().strip()
+            # Get all dd siblings until next dt
+            values = []
+            for sibling in dt.find_next_siblings():
+                if sibling.name == "dt":
+                    break
+                if sibling.name == "dd":
+                    value_text = sibling.get_text().strip()
+                    # Clean up excessive whitespace
+                    value_text = " ".join(value_text.split())
+                    values.append(value_text)
+            if values:
+                field_info["indicators"][indicator_name] = values
+
+    # Extract subfields with detailed descriptions
+    subfields_div = soup.find("div", class_="subfields")
+    if subfields_div:
+        dls = subfields_div.find_all("dl")
+        for dl in dls:
+            dt = dl.find("dt")
+            if not dt:
+                continue
 
-    try:
-        soup = fetch_page(concise_url)
-        field_info = {
-            "definition": "",
-            "indicators": {},
-            "subfields": {},
-            "examples": [],
-        }
+            # Extract subfield code and description from dt
+            dt_text = dt.get_text()
+            # Pattern: $a - Description (R)
+            match = _SUBFIELD_RE.search(dt_text)
+
+            if match:
+                subfield_code = match.group(1).lower()
+                short_desc = match.group(2).strip()
+                repeatability = match.group(3).strip()
+
+                # Get extended description from dd if present
+                extended_desc = ""
+                dd = dl.find("dd")
+                if dd:
+                    extended_desc = " ".join(dd.get_text().split())
+
+                field_info["subfields"][subfield_code] = {
+                    "description": short_desc,
+                    "extended": extended_desc,
+                    "repeatability": repeatability,
+                }
 
-        # Extract definition
-        # Standard pages use <div class="definition"><p>...</p></div>
-        # Control field pages use plain <p> tags after the last <hr/>
-        definition_div = soup.find("div", class_="definition")
-        if definition_div:
-            p_tag = definition_div.find("p")
-            if p_tag:
-                field_info["definition"] = " ".join(p_tag.get_text().split())
-        else:
-            # Fallback: control field pages use plain <p> tags for definition.
-            # Content appears after the <hr/> that follows <div class="datename">.
-            datename_div = soup.find("div", class_="datename")
-            if datename_div:
-                # Find the first <hr/> after the datename div
-                content_hr = None
-                for sibling in datename_div.find_next_siblings():
-                    if sibling.name == "hr":
-                        content_hr = sibling
-                        break
-                if content_hr:
-                    paragraphs = []
-                    for sibling in content_hr.find_next_siblings():
-                        if sibling.name in ("div", "table") and sibling.get("class"):
-                            break  # stop at examples/other sections
-                        if sibling.name == "p":
-                            text = " ".join(sibling.get_text().split())
-                            if text:
-                                paragraphs.append(text)
-                    if paragraphs:
-                        field_info["definition"] = " ".join(paragraphs)
-
-        # Extract indicators
-        indicators_div = soup.find("div", class_="indicators")
-        if indicators_div:
-            dts = indicators_div.find_all("dt")
-            for dt in dts:
-                indicator_name = dt.get_text().strip()
-                # Get all dd siblings until next dt
-                values = []
-                for sibling in dt.find_next_siblings():
-                    if sibling.name == "dt":
-                        break
-                    if sibling.name == "dd":
-                        value_text = sibling.get_text().strip()
-                        # Clean up excessive whitespace
-                        value_text = " ".join(value_text.split())
-                        values.append(value_text)
-                if values:
-                    field_info["indicators"][indicator_name] = values
-
-        # Extract subfields with detailed descriptions
-        subfields_div = soup.find("div", class_="subfields")
-        if subfields_div:
-            dls = subfields_div.find_all("dl")
-            for dl in dls:
-                dt = dl.find("dt")
-                if not dt:
-                    continue
-
-                # Extract subfield code and description from dt
-                dt_text = dt.get_text()
-                # Pattern: $a - Description (R)
-                pattern = r"\$([a-z0-9])\s*[-–]\s*([^(]+?)\s*\(([RN]{1,2})\)"
-                match = re.search(pattern, dt_text, re.IGNORECASE)
-
-                if match:
-                    subfield_code = match.group(1).lower()
-                    short_desc = match.group(2).strip()
-                    repeatability = match.group(3).strip()
-
-                    # Get extended description from dd if present
-                    extended_desc = ""
-                    dd = dl.find("dd")
-                    if dd:
-                        extended_desc = " ".join(dd.get_text().split())
-
-                    field_info["subfields"][subfield_code] = {
-                        "description": short_desc,
-                        "extended": extended_desc,
-                        "repeatability": repeatability,
-                    }
-
-        # Extract examples
-        # Standard pages use <table class="examples">
-        # Control field pages use individual <div class="example"> with nested tables
-        examples_table = soup.find("table", class_="examples")
-        if examples_table:
-            rows = examples_table.find_all("tr")
+    # Extract examples
+    # Standard pages use <table class="examples">
+    # Control field pages use individual <div class="example"> with nested tables
+    examples_table = soup.find("table", class_="examples")
+    if examples_table:
+        rows = examples_table.find_all("tr")
+        for row in rows:
+            cells = row.find_all("td")
+            if len(cells) >= 2:
+                # First cell is field tag, rest is the example
+                example_text = " ".join(cell.get_text().strip() for cell in cells[1:])
+                # Clean up excessive whitespace
+                example_text = " ".join(example_text.split())
+                if example_text:
+                    field_info["examples"].append(example_text)
+    else:
+        # Fallback: control field pages use <div class="example"> per example
+        example_divs = soup.find_all("div", class_="example")
+        for div in example_divs:
+            rows = div.find_all("tr")
             for row in rows:
                 cells = row.find_all("td")
-                if len(cells) >= 2:
-                    # First cell is field tag, rest is the example
-                    example_text = " ".join(
-                        cell.get_text().strip() for cell in cells[1:]
-                    )
-                    # Clean up excessive whitespace
+                # Skip header/spacer rows (all empty)
+                cell_texts = [
+                    c.get_text().strip() for c in cells if c.get_text().strip()
+                ]
+                if len(cell_texts) >= 2:
+                    # First non-empty cell is field tag, rest is data
+                    example_text = " ".join(cell_texts[1:])
                     example_text = " ".join(example_text.split())
                     if example_text:
                         field_info["examples"].append(example_text)
-        else:
-            # Fallback: control field pages use <div class="example"> per example
-            example_divs = soup.find_all("div", class_="example")
-            for div in example_divs:
-                rows = div.find_all("tr")
-                for row in rows:
-                    cells = row.find_all("td")
-                    # Skip header/spacer rows (all empty)
-                    cell_texts = [
-                        c.get_text().strip() for c in cells if c.get_text().strip()
-                    ]
-                    if len(cell_texts) >= 2:
-                        # First non-empty cell is field tag, rest is data
-                        example_text = " ".join(cell_texts[1:])
-                        example_text = " ".join(example_text.split())
-                        if example_text:
-                            field_info["examples"].append(example_text)
 
+    return field_info
+
+
+def _load_parsed(cache_key: str) -> Optional[dict]:
+    """Look up a parsed page; any problem with the cache counts as a miss."""
+    try:
+        with _parsed_cache_lock, shelve.open(str(PARSED_CACHE_FILE)) as cache:
+            return cache.get(cache_key)
+    except Exception as e:
+        log(f"  Parsed page cache unreadable, reparsing: {e}")
+        return None
+
+
+def _store_parsed(cache_key: str, field_info: dict) -> None:
+    """Save a parsed page; failures only cost a reparse next run."""
+    try:
+        with _parsed_cache_lock, shelve.open(str(PARSED_CACHE_FILE)) as cache:
+            cache[cache_key] = field_info
+    except Exception as e:
+        log(f"  Could not cache parsed page: {e}")
+
+
+def extract_detailed_field_info(field_num: str) -> dict:
+    """
+    Fetch detailed field information from the concise LOC page.
+    Returns dict with definition, indicators, subfields, and examples.
+    """
+    # LDR has a non-standard URL
+    if field_num.upper() == "LDR":
+        concise_url = urljoin(BASE_URL, "concise/bdleader.html")
+    else:
+        concise_url = urljoin(BASE_URL, f"concise/bd{field_num}.html")
+
+    try:
+        content = fetch_html(concise_url)
+
+        # Reuse the parsed result if this exact page has been parsed before
+        digest = hashlib.sha256(content).hexdigest()
+        cache_key = f"{PARSED_CACHE_VERSION}:{field_num}:{digest}"
+        field_info = _load_parsed(cache_key)
+        if field_info is None:
+            field_info = parse_detailed_field_info(parse_html(content))
+            _store_parsed(cache_key, field_info)
         return field_info
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            print(
-                f"  No concise page found for field {field_num} (may be control field)"
-            )
+            log(f"  No concise page found for field {field_num} (may be control field)")
             return None
         raise
     except Exception as e:
-        print(f"  Error extracting detailed info for {field_num}: {e}")
+        log(f"  Error extracting detailed info for {field_num}: {e}")
         return None
 
 
@@ -317,18 +416,16 @@ def extract_subfields_from_concise(field_num: str) -> List[Tuple[str, str, str]]
         subfields = []
 
         # Look for subfield patterns: $a - Description (R) or **$a - Description (R)**
-        text_content = soup.get_text()
-
-        # Pattern: $letter/digit - description (R/NR)
-        pattern = r"\$([a-z0-9])\s*[-–]\s*([^(]+?)\s*\(([RN]{1,2})\)"
+        # Only the subfields section when the page has one
+        text_content = (soup.find("div", class_="subfields") or soup).get_text()
 
-        for match in re.finditer(pattern, text_content, re.IGNORECASE):
+        for match in _SUBFIELD_RE.finditer(text_content):
             subfield_code = match.group(1).lower()
             description = match.group(2).strip()
             repeatability = match.group(3).strip()
 
             # Clean up description
-            description = re.sub(r"\s+", " ", description)
+            description = _WS_RE.sub(" ", description)
 
             # Skip if description is too short or looks malformed
             if len(description) < 3:
@@ -340,36 +437,63 @@ def extract_subfields_from_concise(field_num: str) -> List[Tuple[str, str, str]]
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
-            print(
-                f"  No concise page found for field {field_num} (may be control field)"
-            )
+            log(f"  No concise page found for field {field_num} (may be control field)")
             return []
         raise
     except Exception as e:
-        print(f"  Error extracting subfields for {field_num}: {e}")
+        log(f"  Error extracting subfields for {field_num}: {e}")
         return []
 
 
-def scrape_all_fields() -> Dict[str, dict]:
+def fetch_field_details(field_num: str) -> Tuple[dict, List[Tuple[str, str, str]]]:
+    """
+    Fetch everything needed to add a field and its subfields.
+    Returns (detailed_info, fallback_subfields); the fallback subfields are only
+    scraped when the detailed info has none.
+    """
+    detailed_info = extract_detailed_field_info(field_num)
+    if detailed_info and detailed_info.get("subfields"):
+        return detailed_info, []
+    return detailed_info, extract_subfields_from_concise(field_num)
+
+
+def _fetch_all(fn: Callable[[str], Any], args: List[str]) -> List[Any]:
+    """
+    Call fn(arg) for every arg on MAX_WORKERS threads.
+    Returns the results in the order of args.
+    """
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    futures = [executor.submit(fn, arg) for arg in args]
+    try:
+        return [future.result() for future in futures]
+    finally:
+        # On Ctrl-C or a failed call, drop the calls that haven't started
+        # instead of waiting for all of them
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+def scrape_all_fields(timestamp: str) -> Dict[str, dict]:
     """
     Scrape all MARC fields and subfields from LOC documentation.
+    Every entry is stamped with the same "Created" timestamp.
     Returns dictionary in marc.json format with detailed information.
     """
     all_data = {}
-    timestamp = datetime.now(timezone.utc).isoformat()
 
     # Track all field numbers we've seen
     seen_fields = set()
 
-    # Process each field range page
-    for page in FIELD_RANGE_PAGES:
-        print(f"\nProcessing {page}...")
-        url = urljoin(BASE_URL, page)
-        soup = fetch_page(url)
+    # Collect the fields listed on each field range page
+    range_fields = []
+    urls = [urljoin(BASE_URL, page) for page in FIELD_RANGE_PAGES]
+    for page, soup in zip(FIELD_RANGE_PAGES, _fetch_all(fetch_page, urls)):
+        log(f"\nProcessing {page}...")
 
         # Extract field definitions from index page
         fields = extract_field_links(soup)
-        print(f"  Found {len(fields)} fields")
+        log(f"  Found {len(fields)} fields")
 
         for field_num, description, repeatability in fields:
             if field_num in seen_fields:
@@ -380,62 +504,79 @@ def scrape_all_fields() -> Dict[str, dict]:
             if field_num == "222":
                 continue
 
-            # Extract detailed information from the concise page
-            detailed_info = extract_detailed_field_info(field_num)
-
-            # Add the main field entry
-            field_key = field_num
-            # Special case: add (ISBN) to field 020 for better searchability
-            if field_num == "020":
-                field_value = f"{description} (ISBN) ({repeatability})"
-            else:
-                field_value = f"{description} ({repeatability})"
-
-            field_entry = {
-                "Key": field_key,
-                "Value": field_value,
-                "Created": timestamp,
-            }
+            range_fields.append((field_num, description, repeatability))
 
-            # Add detailed info if available
-            if detailed_info:
-                field_entry["Details"] = detailed_info
-
-            all_data[field_key] = field_entry
-            print(f"  Added: {field_key} - {field_value}")
-
-            # Extract subfields (simple format for backward compatibility)
-            if detailed_info and detailed_info.get("subfields"):
-                for subfield_code, subfield_info in detailed_info["subfields"].items():
-                    subfield_key = f"{field_num}{subfield_code}"
-                    subfield_value = f"{subfield_info['description']} ({subfield_info['repeatability']})"
-                    all_data[subfield_key] = {
-                        "Key": subfield_key,
-                        "Value": subfield_value,
-                        "Created": timestamp,
-                    }
-                    print(f"    Added: {subfield_key} - {subfield_value}")
-            else:
-                # Fallback to old method if detailed extraction failed
-                subfields = extract_subfields_from_concise(field_num)
-                for subfield_code, subfield_desc, subfield_repeat in subfields:
-                    subfield_key = f"{field_num}{subfield_code}"
-                    subfield_value = f"{subfield_desc} ({subfield_repeat})"
-                    all_data[subfield_key] = {
-                        "Key": subfield_key,
-                        "Value": subfield_value,
-                        "Created": timestamp,
-                    }
-                    print(f"    Added: {subfield_key} - {subfield_value}")
+    control_fields = [f for f in CONTROL_FIELDS if f[0] not in seen_fields]
+    seen_fields.update(f[0] for f in control_fields)
+    linking_fields = [f for f in LINKING_ENTRY_FIELDS if f[0] not in seen_fields]
+    seen_fields.update(f[0] for f in linking_fields)
 
-    # Process manually defined control fields (LDR, 001-008)
-    print("\nProcessing manually defined control fields (LDR, 001-008)...")
-    for field_num, description, repeatability in CONTROL_FIELDS:
-        if field_num in seen_fields:
-            continue
-        seen_fields.add(field_num)
+    # Fetch the concise pages for every field
+    range_details = _fetch_all(fetch_field_details, [f[0] for f in range_fields])
+    control_details = _fetch_all(
+        extract_detailed_field_info, [f[0] for f in control_fields]
+    )
+    linking_details = _fetch_all(fetch_field_details, [f[0] for f in linking_fields])
 
-        detailed_info = extract_detailed_field_info(field_num)
+    for (field_num, description, repeatability), (
+        detailed_info,
+        fallback_subfields,
+    ) in zip(range_fields, range_details):
+        # Add the main field entry
+        field_key = field_num
+        # Special case: add (ISBN) to field 020 for better searchability
+        if field_num == "020":
+            field_value = f"{description} (ISBN) ({repeatability})"
+        else:
+            field_value = f"{description} ({repeatability})"
+
+        field_entry = {
+            "Key": field_key,
+            "Value": field_value,
+            "Created": timestamp,
+        }
+
+        # Add detailed info if available
+        if detailed_info:
+            field_entry["Details"] = detailed_info
+
+        all_data[field_key] = field_entry
+        log(f"  Added: {field_key} - {field_value}")
+
+        # Extract subfields (simple format for backward compatibility)
+        if detailed_info and detailed_info.get("subfields"):
+            for subfield_code, subfield_info in detailed_info["subfields"].items():
+                subfield_key = f"{field_num}{subfield_code}"
+                subfield_value = (
+                    f"{subfield_info['description']} ({subfield_info['repeatability']})"
+                )
+                all_data[subfield_key] = {
+                    "Key": subfield_key,
+                    "Value": subfield_value,
+                    "Created": timestamp,
+                }
+                log(f"    Added: {subfield_key} - {subfield_value}")
+        else:
+            # Fallback to old method if detailed extraction failed
+            for (
+                subfield_code,
+                subfield_desc,
+                subfield_repeat,
+            ) in fallback_subfields:
+                subfield_key = f"{field_num}{subfield_code}"
+                subfield_value = f"{subfield_desc} ({subfield_repeat})"
+                all_data[subfield_key] = {
+                    "Key": subfield_key,
+                    "Value": subfield_value,
+                    "Created": timestamp,
+                }
+                log(f"    Added: {subfield_key} - {subfield_value}")
+
+    # Process manually defined control fields (LDR, 001-008)
+    log("\nProcessing manually defined control fields (LDR, 001-008)...")
+    for (field_num, description, repeatability), detailed_info in zip(
+        control_fields, control_details
+    ):
         field_value = f"{description} ({repeatability})"
         field_entry = {
             "Key": field_num,
@@ -445,15 +586,14 @@ def scrape_all_fields() -> Dict[str, dict]:
         if detailed_info:
             field_entry["Details"] = detailed_info
         all_data[field_num] = field_entry
-        print(f"  Added: {field_num} - {field_value}")
+        log(f"  Added: {field_num} - {field_value}")
 
     # Add manually defined field 222 (different HTML structure)
-    print("\nAdding manually defined field 222...")
-    timestamp = datetime.now(timezone.utc).isoformat()
+    log("\nAdding manually defined field 222...")
     field_222 = FIELD_222_MANUAL.copy()
     field_222["Created"] = timestamp
     all_data["222"] = field_222
-    print(f"  Added: 222 - Key Title (R)")
+    log(f"  Added: 222 - Key Title (R)")
 
     # Add subfields for field 222
     for subfield_code, subfield_info in FIELD_222_MANUAL["Details"][
@@ -468,18 +608,14 @@ def scrape_all_fields() -> Dict[str, dict]:
             "Value": subfield_value,
             "Created": timestamp,
         }
-        print(f"    Added: {subfield_key} - {subfield_value}")
+        log(f"    Added: {subfield_key} - {subfield_value}")
 
     # Process manually defined linking entry fields (760-788)
-    print("\nProcessing manually defined linking entry fields (760-788)...")
-    for field_num, description, repeatability in LINKING_ENTRY_FIELDS:
-        if field_num in seen_fields:
-            continue
-        seen_fields.add(field_num)
-
-        # Extract detailed information from the concise page
-        detailed_info = extract_detailed_field_info(field_num)
-
+    log("\nProcessing manually defined linking entry fields (760-788)...")
+    for (field_num, description, repeatability), (
+        detailed_info,
+        fallback_subfields,
+    ) in zip(linking_fields, linking_details):
         # Add the main field entry
         field_key = field_num
         field_value = f"{description} ({repeatability})"
@@ -495,7 +631,7 @@ def scrape_all_fields() -> Dict[str, dict]:
             field_entry["Details"] = detailed_info
 
         all_data[field_key] = field_entry
-        print(f"  Added: {field_key} - {field_value}")
+        log(f"  Added: {field_key} - {field_value}")
 
         # Extract subfields
         if detailed_info and detailed_info.get("subfields"):
@@ -509,11 +645,14 @@ def scrape_all_fields() -> Dict[str, dict]:
                     "Value": subfield_value,
                     "Created": timestamp,
                 }
-                print(f"    Added: {subfield_key} - {subfield_value}")
+                log(f"    Added: {subfield_key} - {subfield_value}")
         else:
             # Fallback to old method if detailed extraction failed
-            subfields = extract_subfields_from_concise(field_num)
-            for subfield_code, subfield_desc, subfield_repeat in subfields:
+            for (
+                subfield_code,
+                subfield_desc,
+                subfield_repeat,
+            ) in fallback_subfields:
                 subfield_key = f"{field_num}{subfield_code}"
                 subfield_value = f"{subfield_desc} ({subfield_repeat})"
                 all_data[subfield_key] = {
@@ -521,11 +660,22 @@ def scrape_all_fields() -> Dict[str, dict]:
                     "Value": subfield_value,
                     "Created": timestamp,
                 }
-                print(f"    Added: {subfield_key} - {subfield_value}")
+                log(f"    Added: {subfield_key} - {subfield_value}")
 
     return all_data
 
 
+def json_member(key: str, value: dict) -> bytes:
+    """
+    Serialize one top-level '"key": value' member of a data file, indented to
+    match orjson.OPT_INDENT_2 output for the whole object.
+    """
+    # Newlines only occur between JSON tokens (never raw inside strings), so
+    # shifting every line by one indentation level is safe
+    body = orjson.dumps(value, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  ")
+    return b"  " + orjson.dumps(key) + b": " + body
+
+
 def backup_existing_file(filepath: Path):
     """Create a backup of the existing file."""
     if filepath.exists():
@@ -548,36 +698,45 @@ def main():
 
     # Scrape all fields
     print("\nStarting scrape...")
-    all_data = scrape_all_fields()
-
-    # Sort by key for consistent ordering
-    sorted_data = dict(sorted(all_data.items()))
-
-    # Write verbose file (with Details)
-    print(f"\nWriting {len(sorted_data)} entries to {verbose_file}")
-    with open(verbose_file, "w", encoding="utf-8") as f:
-        json.dump(sorted_data, f, indent=2, ensure_ascii=False)
-
-    # Create simple version (without Details)
-    simple_data = {}
-    for key, entry in sorted_data.items():
-        simple_data[key] = {
-            "Key": entry["Key"],
-            "Value": entry["Value"],
-            "Created": entry["Created"],
-        }
+    all_data = scrape_all_fields(datetime.now(timezone.utc).isoformat())
+
+    # Stream both files in one sorted pass instead of building sorted copies
+    # of the whole dataset first
+    keys = sorted(all_data)
+    print(f"\nWriting {len(keys)} entries to {verbose_file}")
+    print(f"Writing {len(keys)} entries to {simple_file}")
+    with open(verbose_file, "wb") as verbose_out, open(simple_file, "wb") as simple_out:
+        verbose_out.write(b"{")
+        simple_out.write(b"{")
+        for i, key in enumerate(keys):
+            separator = b",\n" if i else b"\n"
+            entry = all_data[key]
+
+            # Verbose file (with Details)
+            verbose_out.write(separator + json_member(key, entry))
+
+            # Simple file (without Details)
+            simple_entry = {
+                "Key": entry["Key"],
+                "Value": entry["Value"],
+                "Created": entry["Created"],
+            }
+            simple_out.write(separator + json_member(key, simple_entry))
+
+        closing = b"\n}" if keys else b"}"
+        verbose_out.write(closing)
+        simple_out.write(closing)
 
-    # Write simple file
-    print(f"Writing {len(simple_data)} entries to {simple_file}")
-    with open(simple_file, "w", encoding="utf-8") as f:
-        json.dump(simple_data, f, indent=2, ensure_ascii=False)
+    # Pre-build the CLI's lookup caches so the first `marc` run doesn't have to
+    for data_file in (verbose_file, simple_file):
+        MarcStore(data_file).build_caches()
 
     print("\nDone!")
-    print(f"Total entries: {len(sorted_data)}")
+    print(f"Total entries: {len(keys)}")
 
     # Count fields vs subfields
-    fields = sum(1 for k in sorted_data.keys() if len(k) == 3)
-    subfields = len(sorted_data) - fields
+    fields = sum(1 for k in keys if len(k) == 3)
+    subfields = len(keys) - fields
     print(f"Fields: {fields}, Subfields: {subfields}")
 
 
@@ -0,0 +1,87 @@
+"""
+Tests for the byte offset index that MarcStore reads entries through.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from marc_cli.main import (
+    Entry,
+    MarcStore,
+    build_index,
+    search_by_code,
+    search_by_keyword,
+)
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def write_with_newlines(path: Path, text: str, newline: str) -> Path:
+    path.write_bytes(text.replace("\n", newline).encode("utf-8"))
+    return path
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+@pytest.mark.parametrize("name", ["marc.json", "marc-verbose.json"])
+def test_every_entry_round_trips(tmp_path, name, newline):
+    text = (REPO_ROOT / name).read_text(encoding="utf-8")
+    expected = json.loads(text)
+    store = MarcStore(write_with_newlines(tmp_path / name, text, newline))
+
+    assert store.keys_with_prefix("") == sorted(expected, key=str.lower)
+    for key, value in expected.items():
+        assert store.get(key) == Entry(**value)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+def test_offsets_after_non_ascii_text(tmp_path, newline):
+    # Multi-byte characters before an entry shift its byte offset away from
+    # its character offset
+    data = {
+        "222": {"Key": "222", "Value": "Öffentliche Dienst (Köln) (R)", "Created": ""},
+        "222a": {"Key": "222a", "Value": "Key title (NR)", "Created": ""},
+    }
+    path = write_with_newlines(
+        tmp_path / "marc.json", json.dumps(data, indent=2, ensure_ascii=False), newline
+    )
+    raw = path.read_bytes()
+
+    for key, (offset, length) in build_index(path).items():
+        assert json.loads(raw[offset : offset + length]) == data[key]
+
+
+def stale_caches(tmp_path: Path) -> Path:
+    """
+    Build a data file's caches, then rename field 013 and its subfields to 014
+    without changing the file's size or mtime, so the caches still match it.
+    """
+    path = tmp_path / "marc.json"
+    text = (REPO_ROOT / "marc.json").read_text(encoding="utf-8")
+    path.write_text(text, encoding="utf-8")
+    MarcStore(path).build_caches()
+
+    stat = path.stat()
+    path.write_text(text.replace('"013', '"014'), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+    return path
+
+
+@pytest.mark.parametrize(
+    "search, query",
+    [(search_by_code, "013"), (search_by_keyword, "patent")],
+    ids=["code", "keyword"],
+)
+def test_recovers_from_caches_that_look_valid(tmp_path, search, query):
+    path = stale_caches(tmp_path)
+
+    # Keys that have gone are dropped rather than raising...
+    assert search(MarcStore(path), query) == []
+
+    # ...and every cache has been rebuilt for the next run
+    store = MarcStore(path)
+    assert search_by_code(store, "014")[0][1].Value == "Patent Control Information (R)"
+    assert search_by_keyword(store, "patent")[0][0] == "014"